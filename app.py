@@ -1,118 +1,393 @@
 import streamlit as st
+import atexit
 import json
 import os
+import sys
+import time
 from datetime import datetime
+from uuid import uuid4
 from typing import List, Dict, Any
 
-DATA_FILE = "tasks.json"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+
+    _IMPORT_ERRORS = (ValueError, ijson.common.JSONError)
+except ImportError:
+    ijson = None
+    _IMPORT_ERRORS = (ValueError,)
+
+DATA_FILE = "tasks.json"  # legacy single-file format, migrated on first load
+TASKS_SNAPSHOT = "tasks.jsonl"
+TASKS_LOG = "tasks.log.jsonl"
+PAGE_SIZE = 50  # tasks rendered per page
+
+CSS_BLOCK = """
+<style>
+.stats-card {
+    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+}
+</style>
+"""
+
+
+# Memoized so reruns replay a stable element instead of rebuilding the
+# CSS markdown node on every click
+@st.cache_resource
+def _inject_css() -> None:
+    st.markdown(CSS_BLOCK, unsafe_allow_html=True)
+
+
+# Pretty-printed serialization, used only for the human-facing export
+# download; everything written to disk goes through the compact dumps_line.
+# Underscore-prefixed keys are derived caches, not part of the task schema,
+# and are stripped from the export.
+def dumps_tasks(tasks: List[Dict[str, Any]]) -> bytes:
+    clean = [
+        {k: v for k, v in task.items() if not k.startswith("_")} for task in tasks
+    ]
+    if orjson is not None:
+        return orjson.dumps(clean, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(clean, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# One compact JSON line for the snapshot/log files
+def dumps_line(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 # Task data structure
 def create_task(text: str, priority: str = "Medium") -> Dict[str, Any]:
+    tid = st.session_state.next_id
+    st.session_state.next_id += 1
+    now = datetime.now()
     return {
-        "id": datetime.now().timestamp(),
+        "id": tid,
         "task": text,
+        "_sort_key_alpha": text.lower(),
         "done": False,
         "priority": priority,
-        "created_at": datetime.now().isoformat(),
+        "created_at": now.isoformat(),
+        "_created_display": now.strftime("%m/%d/%Y %H:%M"),
         "completed_at": None,
+        "_completed_display": None,
     }
 
 
-# Load tasks
+# Fill in fields that older task files (or imports) may lack. Callers
+# looping over many tasks pass one now_iso rather than a per-task call.
+def normalize_compat_fields(task: Dict[str, Any], now_iso: str) -> None:
+    if "priority" not in task:
+        task["priority"] = "Medium"
+    if "created_at" not in task:
+        task["created_at"] = now_iso
+    if "completed_at" not in task:
+        task["completed_at"] = None
+    if "_sort_key_alpha" not in task:
+        task["_sort_key_alpha"] = task.get("task", "").lower()
+    # Pre-rendered date strings: parse ISO timestamps once here, never in
+    # the render loop
+    if "_created_display" not in task:
+        task["_created_display"] = datetime.fromisoformat(
+            task["created_at"]
+        ).strftime("%m/%d/%Y %H:%M")
+    if "_completed_display" not in task:
+        task["_completed_display"] = (
+            datetime.fromisoformat(task["completed_at"]).strftime("%m/%d/%Y %H:%M")
+            if task["completed_at"]
+            else None
+        )
+
+
+# Parse the snapshot once per (mtime, size); new sessions hit the cache
+# instead of re-reading the file, and any external edit invalidates it.
+# st.cache_data hands each caller its own copy, so in-place task mutations
+# cannot corrupt the cached value. Bounded: each compaction changes the
+# mtime, and stale snapshots are never re-read.
+@st.cache_data(max_entries=2)
+def _read_snapshot_cached(mtime: float, size: int) -> Dict[Any, Dict[str, Any]]:
+    by_id: Dict[Any, Dict[str, Any]] = {}
+    with open(TASKS_SNAPSHOT, "rb") as f:
+        for line in f:
+            if line.strip():
+                task = loads_json(line)
+                by_id[task["id"]] = task
+    return by_id
+
+
+# Migrate the legacy single-array tasks.json to the snapshot format.
+# Ids are renumbered and the snapshot is written (and tasks.json retired)
+# BEFORE any op can be logged, so log replay keys always match the
+# persisted int ids.
+def _migrate_legacy_file() -> Dict[Any, Dict[str, Any]]:
+    with open(DATA_FILE, "rb") as f:
+        tasks = loads_json(f.read())
+    next_id = (
+        max(
+            (t["id"] for t in tasks if isinstance(t.get("id"), int) and t["id"] > 0),
+            default=0,
+        )
+        + 1
+    )
+    now_iso = datetime.now().isoformat()
+    for task in tasks:
+        if not isinstance(task.get("id"), int) or task["id"] <= 0:
+            task["id"] = next_id
+            next_id += 1
+        normalize_compat_fields(task, now_iso)
+    tmp = TASKS_SNAPSHOT + ".tmp"
+    with open(tmp, "wb") as f:
+        for task in tasks:
+            f.write(dumps_line(task) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, TASKS_SNAPSHOT)
+    os.replace(DATA_FILE, DATA_FILE + ".bak")
+    return {task["id"]: task for task in tasks}
+
+
+# Load tasks: stream the snapshot line-by-line, then replay the op log
 def load_tasks() -> List[Dict[str, Any]]:
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                tasks = json.load(f)
-                # Ensure backward compatibility
-                for task in tasks:
-                    if "id" not in task:
-                        task["id"] = datetime.now().timestamp()
-                    if "priority" not in task:
-                        task["priority"] = "Medium"
-                    if "created_at" not in task:
-                        task["created_at"] = datetime.now().isoformat()
-                    if "completed_at" not in task:
-                        task["completed_at"] = None
-                return tasks
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
-    return []
-
-
-# Save tasks
-def save_tasks(tasks: List[Dict[str, Any]]) -> None:
     try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(tasks, f, indent=2, ensure_ascii=False)
+        by_id: Dict[Any, Dict[str, Any]] = {}
+        if os.path.exists(TASKS_SNAPSHOT):
+            stat = os.stat(TASKS_SNAPSHOT)
+            by_id = _read_snapshot_cached(stat.st_mtime, stat.st_size)
+        elif os.path.exists(DATA_FILE):
+            by_id = _migrate_legacy_file()
+        log_count = 0
+        if os.path.exists(TASKS_LOG):
+            with open(TASKS_LOG, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    op = loads_json(line)
+                    log_count += 1
+                    if op["k"] == "del":
+                        by_id.pop(op["id"], None)
+                    else:
+                        by_id[op["id"]] = op["t"]
+        st.session_state.log_count = log_count
+        tasks = list(by_id.values())
+        # Ensure backward compatibility (migration already fixed the ids)
+        now_iso = datetime.now().isoformat()
+        for task in tasks:
+            normalize_compat_fields(task, now_iso)
+        return tasks
+    except (ValueError, OSError):
+        return []
+
+
+# Buffer one mutation in memory; the op log is flushed lazily (debounced)
+def append_op(op: Dict[str, Any]) -> None:
+    st.session_state.pending_ops.append(dumps_line(op) + b"\n")
+    st.session_state.tasks_dirty = True
+    st.session_state.tasks_version += 1
+
+
+# Flush buffered ops to the log in one write; compact once it outgrows the snapshot
+def flush_tasks(force: bool = False) -> None:
+    if not st.session_state.get("tasks_dirty"):
+        return
+    if not force and time.monotonic() - st.session_state.last_flush_ts < 1.0:
+        return
+    try:
+        ops = st.session_state.pending_ops
+        with open(TASKS_LOG, "ab") as f:
+            f.write(b"".join(ops))
+        st.session_state.log_count = st.session_state.get("log_count", 0) + len(ops)
+        ops.clear()
+        st.session_state.tasks_dirty = False
+        st.session_state.last_flush_ts = time.monotonic()
+        if st.session_state.log_count > len(st.session_state.tasks):
+            compact_tasks()
     except Exception as e:
         st.error(f"Error saving tasks: {e}")
 
 
+# Runs at interpreter exit, where there is no script context and
+# st.session_state cannot be read: the pending-ops list is captured at
+# registration time instead. Compaction is skipped; the ops alone are
+# enough for the next load to replay.
+def _flush_at_exit(pending_ops: List[bytes]) -> None:
+    if not pending_ops:
+        return
+    try:
+        with open(TASKS_LOG, "ab") as f:
+            f.write(b"".join(pending_ops))
+        pending_ops.clear()
+    except OSError as e:
+        print(f"Error saving tasks on exit: {e}", file=sys.stderr)
+
+
+# Rewrite the snapshot from the in-memory list and truncate the op log.
+# Writes go to a temp file that replaces the snapshot atomically, so a
+# crash mid-write can never truncate the existing snapshot.
+def compact_tasks() -> None:
+    try:
+        tmp = TASKS_SNAPSHOT + ".tmp"
+        with open(tmp, "wb") as f:
+            for task in st.session_state.tasks:
+                f.write(dumps_line(task) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, TASKS_SNAPSHOT)
+        open(TASKS_LOG, "wb").close()
+        st.session_state.log_count = 0
+        st.session_state.pending_ops.clear()
+        st.session_state.tasks_dirty = False
+        st.session_state.last_flush_ts = time.monotonic()
+    except Exception as e:
+        st.error(f"Error saving tasks: {e}")
+
+
+# Rebuild the id -> list-index map used for O(1) single-task lookups
+def rebuild_task_index() -> None:
+    st.session_state.task_index = {
+        task["id"]: i for i, task in enumerate(st.session_state.tasks)
+    }
+
+
 # Toggle task completion
-def toggle_task_completion(task_id: float) -> None:
-    for task in st.session_state.tasks:
-        if task["id"] == task_id:
-            task["done"] = not task["done"]
-            task["completed_at"] = datetime.now().isoformat() if task["done"] else None
-            break
-    save_tasks(st.session_state.tasks)
-
-
-# Delete task
-def delete_task(task_id: float) -> None:
-    st.session_state.tasks = [
-        task for task in st.session_state.tasks if task["id"] != task_id
-    ]
-    save_tasks(st.session_state.tasks)
+def toggle_task_completion(task_id: int) -> None:
+    idx = st.session_state.task_index.get(task_id)
+    if idx is None:
+        return
+    task = st.session_state.tasks[idx]
+    task["done"] = not task["done"]
+    if task["done"]:
+        now = datetime.now()
+        task["completed_at"] = now.isoformat()
+        task["_completed_display"] = now.strftime("%m/%d/%Y %H:%M")
+    else:
+        task["completed_at"] = None
+        task["_completed_display"] = None
+    append_op({"k": "upd", "id": task_id, "t": task})
+
+
+# Delete task in place; later index entries shift down by one
+def delete_task(task_id: int) -> None:
+    idx = st.session_state.task_index.pop(task_id, None)
+    if idx is None:
+        return
+    st.session_state.tasks.pop(idx)
+    index = st.session_state.task_index
+    for tid, i in index.items():
+        if i > idx:
+            index[tid] = i - 1
+    append_op({"k": "del", "id": task_id})
 
 
 # Edit task
-def edit_task(task_id: float, new_text: str, new_priority: str) -> None:
-    for task in st.session_state.tasks:
-        if task["id"] == task_id:
-            task["task"] = new_text
-            task["priority"] = new_priority
-            break
-    save_tasks(st.session_state.tasks)
-
-
-# Get priority color and icon
-def get_priority_style(priority: str) -> tuple:
-    styles = {
-        "High": ("🔴", "#ff4b4b"),
-        "Medium": ("🟡", "#ffa500"),
-        "Low": ("🟢", "#00b050"),
-    }
-    return styles.get(priority, ("🟡", "#ffa500"))
+def edit_task(task_id: int, new_text: str, new_priority: str) -> None:
+    idx = st.session_state.task_index.get(task_id)
+    if idx is None:
+        return
+    task = st.session_state.tasks[idx]
+    task["task"] = new_text
+    task["_sort_key_alpha"] = new_text.lower()
+    task["priority"] = new_priority
+    append_op({"k": "upd", "id": task_id, "t": task})
+
+
+# Priority sort ranks, built once at import time
+_PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
+
+
+# One pass over the tasks for the sidebar metrics
+def summarize(tasks: List[Dict[str, Any]]) -> tuple:
+    done_count = 0
+    for task in tasks:
+        if task["done"]:
+            done_count += 1
+    return len(tasks), done_count
+
+
+# Filter + sort, cached on a cheap version counter bumped on every
+# mutation: pure-UI reruns (e.g. entering edit mode) hit the cache.
+# The session salt keeps entries from leaking between sessions, since
+# st.cache_data is shared but the tasks read here are per-session.
+# Bounded: the version counter only ever increments, so without
+# max_entries every mutation would pin a task-list copy forever.
+@st.cache_data(max_entries=8)
+def _filter_and_sort(
+    salt: str, version: int, sort_option: str, show_completed: bool
+) -> List[Dict[str, Any]]:
+    visible = [
+        t for t in st.session_state.tasks if show_completed or not t["done"]
+    ]
+    return sort_tasks(visible, sort_option)
+
+
+# Sort order memo: hashable key tuples in, permutation of indices out, so
+# reruns without mutations reuse the previous order instead of re-sorting.
+# Bounded: only the latest order per sort mode is worth keeping.
+@st.cache_data(max_entries=8)
+def _compute_order(dones: tuple, keys: tuple) -> List[int]:
+    return [i for _, _, i in sorted(zip(dones, keys, range(len(dones))))]
 
 
 # Sort tasks
 def sort_tasks(tasks: List[Dict[str, Any]], sort_by: str) -> List[Dict[str, Any]]:
     if sort_by == "Priority":
-        priority_order = {"High": 0, "Medium": 1, "Low": 2}
-        return sorted(
-            tasks, key=lambda x: (x["done"], priority_order.get(x["priority"], 1))
-        )
+        keys = tuple(_PRIORITY_ORDER.get(t["priority"], 1) for t in tasks)
     elif sort_by == "Created Date":
-        return sorted(tasks, key=lambda x: (x["done"], x["created_at"]))
+        keys = tuple(t["created_at"] for t in tasks)
     elif sort_by == "Alphabetical":
-        return sorted(tasks, key=lambda x: (x["done"], x["task"].lower()))
-    return tasks
+        # Precomputed lowercase key avoids per-comparison .lower() calls
+        keys = tuple(t["_sort_key_alpha"] for t in tasks)
+    else:
+        return tasks
+    dones = tuple(t["done"] for t in tasks)
+    return [tasks[i] for i in _compute_order(dones, keys)]
 
 
 # Initialize session state
 if "tasks" not in st.session_state:
     st.session_state.tasks = load_tasks()
 
+if "task_index" not in st.session_state:
+    rebuild_task_index()
+
+if "next_id" not in st.session_state:
+    st.session_state.next_id = (
+        max((t["id"] for t in st.session_state.tasks), default=0) + 1
+    )
+
+if "tasks_version" not in st.session_state:
+    st.session_state.tasks_version = 0
+    st.session_state.session_salt = uuid4().hex
+
+if "tasks_dirty" not in st.session_state:
+    st.session_state.tasks_dirty = False
+    st.session_state.pending_ops = []
+    st.session_state.last_flush_ts = time.monotonic()
+    atexit.register(_flush_at_exit, st.session_state.pending_ops)
+
 if "show_completed" not in st.session_state:
     st.session_state.show_completed = True
 
-if "edit_mode" not in st.session_state:
-    st.session_state.edit_mode = {}
+if "page" not in st.session_state:
+    st.session_state.page = 0
 
-# Page configuration
+# Page configuration (must stay the first Streamlit command: the flush
+# error path calls st.error)
 st.set_page_config(
     page_title="Enhanced To-Do List",
     page_icon="./assets/logo.png",
@@ -120,31 +395,13 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Debounced flush: collapses a burst of rapid mutations into one write
+flush_tasks()
+
+total_tasks, completed_tasks = summarize(st.session_state.tasks)
+
 # Custom CSS
-st.markdown(
-    """
-<style>
-.task-container {
-    border-radius: 10px;
-    padding: 1rem;
-    margin: 0.5rem 0;
-    border-left: 4px solid;
-}
-.high-priority { border-left-color: #ff4b4b; background-color: #fff5f5; }
-.medium-priority { border-left-color: #ffa500; background-color: #fffbf0; }
-.low-priority { border-left-color: #00b050; background-color: #f0fff4; }
-.completed-task { opacity: 0.6; }
-.stats-card {
-    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    padding: 1rem;
-    border-radius: 10px;
-    text-align: center;
-}
-</style>
-""",
-    unsafe_allow_html=True,
-)
+_inject_css()
 
 # Header
 st.title("✅ Enhanced To-Do List")
@@ -154,9 +411,7 @@ st.markdown("*Stay organized and productive with priority management*")
 with st.sidebar:
     st.header("📊 Dashboard")
 
-    # Statistics
-    total_tasks = len(st.session_state.tasks)
-    completed_tasks = sum(1 for task in st.session_state.tasks if task["done"])
+    # Statistics (single pass done above)
     pending_tasks = total_tasks - completed_tasks
 
     col1, col2, col3 = st.columns(3)
@@ -177,28 +432,45 @@ with st.sidebar:
     # Filters and sorting
     st.header("🔧 Options")
     sort_option = st.selectbox("Sort by", ["Priority", "Created Date", "Alphabetical"])
-    st.session_state.show_completed = st.checkbox(
-        "Show completed tasks", value=st.session_state.show_completed
-    )
+    st.checkbox("Show completed tasks", key="show_completed")
 
     # Clear completed tasks
     if completed_tasks > 0:
         if st.button("🗑️ Clear Completed", use_container_width=True):
-            st.session_state.tasks = [
-                task for task in st.session_state.tasks if not task["done"]
-            ]
-            save_tasks(st.session_state.tasks)
+            # Two-pointer in-place compaction: no filtered-copy allocation
+            tasks = st.session_state.tasks
+            dst = 0
+            for src in range(len(tasks)):
+                if not tasks[src]["done"]:
+                    tasks[dst] = tasks[src]
+                    dst += 1
+            del tasks[dst:]
+            rebuild_task_index()
+            st.session_state.tasks_version += 1
+            compact_tasks()
             st.rerun()
 
     # Export/Import
     st.divider()
     st.header("💾 Data Management")
 
+    if st.button("💾 Save Now", use_container_width=True):
+        flush_tasks(force=True)
+        st.success("Tasks saved!")
+
     if st.button("📥 Export Tasks", use_container_width=True):
         if st.session_state.tasks:
+            # Serialize only on click, and reuse the bytes until the tasks
+            # change again (the on-disk JSONL is a different format, so the
+            # export payload is cached on its own version marker)
+            if st.session_state.get("_export_version") != (
+                st.session_state.tasks_version
+            ):
+                st.session_state._export_bytes = dumps_tasks(st.session_state.tasks)
+                st.session_state._export_version = st.session_state.tasks_version
             st.download_button(
                 "Download JSON",
-                data=json.dumps(st.session_state.tasks, indent=2),
+                data=st.session_state._export_bytes,
                 file_name=f"tasks_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json",
             )
@@ -206,13 +478,31 @@ with st.sidebar:
     uploaded_file = st.file_uploader("📤 Import Tasks", type="json")
     if uploaded_file:
         try:
-            imported_tasks = json.load(uploaded_file)
             if st.button("Confirm Import"):
-                st.session_state.tasks.extend(imported_tasks)
-                save_tasks(st.session_state.tasks)
-                st.success(f"Imported {len(imported_tasks)} tasks!")
+                # Stream the top-level array element-by-element when ijson is
+                # available; avoids materializing the whole upload twice
+                if ijson is not None:
+                    items = ijson.items(uploaded_file, "item")
+                else:
+                    items = loads_json(uploaded_file.read())
+                # Stage streamed items locally so a file that fails
+                # mid-parse leaves session state untouched
+                staged = []
+                now_iso = datetime.now().isoformat()
+                for task in items:
+                    if not isinstance(task, dict):
+                        raise ValueError("task items must be JSON objects")
+                    normalize_compat_fields(task, now_iso)
+                    task["id"] = st.session_state.next_id + len(staged)
+                    staged.append(task)
+                st.session_state.next_id += len(staged)
+                st.session_state.tasks.extend(staged)
+                rebuild_task_index()
+                st.session_state.tasks_version += 1
+                compact_tasks()
+                st.success(f"Imported {len(staged)} tasks!")
                 st.rerun()
-        except json.JSONDecodeError:
+        except _IMPORT_ERRORS:
             st.error("Invalid JSON file")
 
 # Main content
@@ -232,7 +522,10 @@ with st.form("add_task_form", clear_on_submit=True):
     if submitted and new_task.strip():
         new_task_obj = create_task(new_task.strip(), priority)
         st.session_state.tasks.append(new_task_obj)
-        save_tasks(st.session_state.tasks)
+        st.session_state.task_index[new_task_obj["id"]] = (
+            len(st.session_state.tasks) - 1
+        )
+        append_op({"k": "add", "id": new_task_obj["id"], "t": new_task_obj})
         st.success(f"Added task: {new_task}")
         st.rerun()
 
@@ -240,115 +533,111 @@ with st.form("add_task_form", clear_on_submit=True):
 st.header("📋 Your Tasks")
 
 if st.session_state.tasks:
-    # Filter tasks based on show_completed setting
-    filtered_tasks = st.session_state.tasks
-    if not st.session_state.show_completed:
-        filtered_tasks = [task for task in st.session_state.tasks if not task["done"]]
+    # Filter + sort, skipped entirely when nothing has changed
+    sorted_tasks = _filter_and_sort(
+        st.session_state.session_salt,
+        st.session_state.tasks_version,
+        sort_option,
+        st.session_state.show_completed,
+    )
 
-    # Sort tasks
-    sorted_tasks = sort_tasks(filtered_tasks, sort_option)
+    # Render only the current page so rerun cost stays bounded
+    num_pages = max(1, -(-len(sorted_tasks) // PAGE_SIZE))
+    if st.session_state.page >= num_pages:
+        st.session_state.page = num_pages - 1
+    start = st.session_state.page * PAGE_SIZE
+    view = sorted_tasks[start : start + PAGE_SIZE]
 
-    if not sorted_tasks:
+    if not view:
         st.info("No tasks to display with current filters.")
     else:
-        for task in sorted_tasks:
-            task_id = task["id"]
-            priority_icon, priority_color = get_priority_style(task["priority"])
-
-            # Task container
-            with st.container():
-                if task["done"]:
-                    container_class = "completed-task"
-                else:
-                    priority_class = f"{task['priority'].lower()}-priority"
-                    container_class = f"task-container {priority_class}"
-
-                col1, col2, col3, col4 = st.columns([0.1, 0.7, 0.1, 0.1])
-
-                # Checkbox
-                with col1:
-                    is_done = st.checkbox(
-                        "",
-                        value=task["done"],
-                        key=f"check_{task_id}",
-                        label_visibility="collapsed",
+        # One data_editor grid instead of N per-task widgets: toggling,
+        # editing, and row deletion all happen inside a single widget
+        rows = [
+            {
+                "id": task["id"],
+                "done": task["done"],
+                "task": task["task"],
+                "priority": task["priority"],
+                "created": task["_created_display"],
+            }
+            for task in view
+        ]
+        edited_rows = st.data_editor(
+            rows,
+            num_rows="dynamic",
+            use_container_width=True,
+            # Re-key on the data version so applied edits become the new
+            # baseline instead of being re-reported every rerun
+            key=f"task_grid_{st.session_state.tasks_version}",
+            column_config={
+                "id": None,
+                "done": st.column_config.CheckboxColumn("Done"),
+                "task": st.column_config.TextColumn("Task", required=True),
+                "priority": st.column_config.SelectboxColumn(
+                    "Priority", options=["High", "Medium", "Low"]
+                ),
+                "created": st.column_config.TextColumn("Created"),
+            },
+            disabled=["created"],
+        )
+
+        # Diff the grid against the rendered slice by id and apply changes
+        prev_by_id = {task["id"]: task for task in view}
+        seen_ids = set()
+        changed = False
+        for row in edited_rows:
+            task_id = row.get("id")
+            if task_id is None:
+                # Row added in the grid
+                text = str(row.get("task") or "").strip()
+                if text:
+                    new_task_obj = create_task(
+                        text, row.get("priority") or "Medium"
                     )
-                    if is_done != task["done"]:
-                        toggle_task_completion(task_id)
-                        st.rerun()
-
-                # Task content
-                with col2:
-                    if (
-                        task_id in st.session_state.edit_mode
-                        and st.session_state.edit_mode[task_id]
-                    ):
-                        # Edit mode
-                        edit_col1, edit_col2 = st.columns([3, 1])
-                        with edit_col1:
-                            edited_text = st.text_input(
-                                "",
-                                value=task["task"],
-                                key=f"edit_text_{task_id}",
-                                label_visibility="collapsed",
-                            )
-                        with edit_col2:
-                            edited_priority = st.selectbox(
-                                "",
-                                ["High", "Medium", "Low"],
-                                index=["High", "Medium", "Low"].index(task["priority"]),
-                                key=f"edit_priority_{task_id}",
-                                label_visibility="collapsed",
-                            )
-
-                        # Save/Cancel buttons
-                        save_col, cancel_col = st.columns(2)
-                        with save_col:
-                            if st.button("💾", key=f"save_{task_id}", help="Save"):
-                                edit_task(task_id, edited_text, edited_priority)
-                                st.session_state.edit_mode[task_id] = False
-                                st.rerun()
-                        with cancel_col:
-                            if st.button("❌", key=f"cancel_{task_id}", help="Cancel"):
-                                st.session_state.edit_mode[task_id] = False
-                                st.rerun()
-                    else:
-                        # Display mode
-                        task_text = task["task"]
-                        if task["done"]:
-                            st.markdown(
-                                f"{priority_icon} ~~{task_text}~~ *({task['priority']} priority)*"
-                            )
-                            if task.get("completed_at"):
-                                completed_date = datetime.fromisoformat(
-                                    task["completed_at"]
-                                ).strftime("%m/%d/%Y %H:%M")
-                                st.caption(f"Completed on {completed_date}")
-                        else:
-                            st.markdown(
-                                f"{priority_icon} **{task_text}** *({task['priority']} priority)*"
-                            )
-                            created_date = datetime.fromisoformat(
-                                task["created_at"]
-                            ).strftime("%m/%d/%Y %H:%M")
-                            st.caption(f"Created on {created_date}")
-
-                # Edit button
-                with col3:
-                    if not task["done"]:
-                        if st.button("✏️", key=f"edit_{task_id}", help="Edit task"):
-                            st.session_state.edit_mode[task_id] = True
-                            st.rerun()
-
-                # Delete button
-                with col4:
-                    if st.button("🗑️", key=f"delete_{task_id}", help="Delete task"):
-                        delete_task(task_id)
-                        if task_id in st.session_state.edit_mode:
-                            del st.session_state.edit_mode[task_id]
-                        st.rerun()
-
-                st.divider()
+                    st.session_state.tasks.append(new_task_obj)
+                    st.session_state.task_index[new_task_obj["id"]] = (
+                        len(st.session_state.tasks) - 1
+                    )
+                    append_op(
+                        {"k": "add", "id": new_task_obj["id"], "t": new_task_obj}
+                    )
+                    if row.get("done"):
+                        toggle_task_completion(new_task_obj["id"])
+                    changed = True
+                continue
+            seen_ids.add(task_id)
+            prev = prev_by_id.get(task_id)
+            if prev is None:
+                continue
+            if row["task"] != prev["task"] or row["priority"] != prev["priority"]:
+                edit_task(task_id, row["task"], row["priority"])
+                changed = True
+            if row["done"] != prev["done"]:
+                toggle_task_completion(task_id)
+                changed = True
+        for task_id in prev_by_id.keys() - seen_ids:
+            # Row removed in the grid
+            delete_task(task_id)
+            changed = True
+        if changed:
+            st.rerun()
+
+        # Pagination controls
+        if num_pages > 1:
+            prev_col, next_col, info_col = st.columns([1, 1, 6])
+            with prev_col:
+                if st.button("⬅️", disabled=st.session_state.page == 0):
+                    st.session_state.page -= 1
+                    st.rerun()
+            with next_col:
+                if st.button(
+                    "➡️", disabled=st.session_state.page >= num_pages - 1
+                ):
+                    st.session_state.page += 1
+                    st.rerun()
+            with info_col:
+                st.caption(f"Page {st.session_state.page + 1} of {num_pages}")
 
 else:
     st.info("🎉 No tasks yet! Add your first task above to get started.")